@@ -5,7 +5,8 @@ import asyncio
 from datetime import timedelta
 import logging
 from math import ceil
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from pyclimacell import ClimaCellV3, ClimaCellV4
 from pyclimacell.const import CURRENT, DAILY, FORECASTS, HOURLY, NOWCAST
@@ -78,6 +79,9 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [SENSOR_DOMAIN, WEATHER_DOMAIN]
 
+# Shared read-only default for lookups on missing data
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
 
 def _set_update_interval(hass: HomeAssistant, current_entry: ConfigEntry) -> timedelta:
     """Recalculate update_interval based on existing ClimaCell instances and update them."""
@@ -337,7 +341,7 @@ class ClimaCellEntity(CoordinatorEntity):
 
         Used for V3 API.
         """
-        items = weather_dict.get(key, {})
+        items = weather_dict.get(key, _EMPTY_MAP)
         # Handle cases where value returned is a list.
         # Optimistically find the best value to return.
         if isinstance(items, list):
@@ -359,7 +363,7 @@ class ClimaCellEntity(CoordinatorEntity):
 
         Used for V4 API.
         """
-        return self.coordinator.data.get(CURRENT, {}).get(property_name)
+        return self.coordinator.data.get(CURRENT, _EMPTY_MAP).get(property_name)
 
     @property
     def attribution(self):
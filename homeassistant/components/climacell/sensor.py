@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from enum import IntEnum
+from functools import lru_cache
 import logging
 from typing import Any, Callable, Mapping
 
@@ -36,6 +38,12 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _value_map_name(value_map: type[IntEnum], value: int) -> str:
+    """Return the lowercase enum member name for a raw ClimaCell value."""
+    return value_map(value).name.lower()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -116,8 +124,9 @@ class BaseClimaCellSensorEntity(ClimaCellEntity, SensorEntity):
     @property
     def state(self) -> str | int | float | None:
         """Return the state."""
+        state = self._state
         if (
-            self._state is not None
+            state is not None
             and CONF_UNIT_SYSTEM_IMPERIAL in self.sensor_type
             and CONF_UNIT_SYSTEM_METRIC in self.sensor_type
             and ATTR_METRIC_CONVERSION in self.sensor_type
@@ -125,11 +134,11 @@ class BaseClimaCellSensorEntity(ClimaCellEntity, SensorEntity):
             and self.hass.config.units.is_metric
             == self.sensor_type[ATTR_IS_METRIC_CHECK]
         ):
-            return round(self._state * self.sensor_type[ATTR_METRIC_CONVERSION], 4)
+            return round(state * self.sensor_type[ATTR_METRIC_CONVERSION], 4)
 
         if ATTR_VALUE_MAP in self.sensor_type:
-            return self.sensor_type[ATTR_VALUE_MAP](self._state).name.lower()
-        return self._state
+            return _value_map_name(self.sensor_type[ATTR_VALUE_MAP], state)
+        return state
 
 
 class ClimaCellSensorEntity(BaseClimaCellSensorEntity):
@@ -3,7 +3,10 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from datetime import datetime
+from functools import cached_property
+import inspect
 import logging
+from types import MappingProxyType
 from typing import Any, Callable, Mapping
 
 from pyclimacell.const import (
@@ -31,22 +34,16 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_API_VERSION,
     CONF_NAME,
-    LENGTH_FEET,
-    LENGTH_KILOMETERS,
-    LENGTH_METERS,
-    LENGTH_MILES,
-    PRESSURE_HPA,
-    PRESSURE_INHG,
+    SUN_EVENT_SUNRISE,
+    SUN_EVENT_SUNSET,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.sun import is_up
+from homeassistant.helpers.sun import get_astral_event_next, is_up
 from homeassistant.util import dt as dt_util
-from homeassistant.util.distance import convert as distance_convert
-from homeassistant.util.pressure import convert as pressure_convert
 
-from . import ClimaCellDataUpdateCoordinator, ClimaCellEntity
+from . import _EMPTY_MAP, ClimaCellDataUpdateCoordinator, ClimaCellEntity
 from .const import (
     ATTR_CLOUD_COVER,
     ATTR_PRECIPITATION_TYPE,
@@ -95,6 +92,33 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Imperial to metric conversion factors for values returned by the API
+_IN_TO_MM = 25.4
+_INHG_TO_HPA = 33.86389
+_MI_TO_KM = 1.609344
+
+# Plain int lookup tables so raw API values don't need to go through the enums
+_CLEAR_CODES = {int(WeatherCode.CLEAR), int(WeatherCode.MOSTLY_CLEAR)}
+_CODE_TO_CONDITION = {int(code): condition for code, condition in CONDITIONS.items()}
+_PRECIPITATION_TYPES = {
+    int(member): member.name.lower() for member in PrecipitationType
+}
+
+# V3 weather codes that map to a day/night dependent clear condition
+_CLEAR_CONDITIONS_V3 = frozenset({"clear", "mostly_clear"})
+
+
+def _first_forecast_index(raw_forecasts: list[dict[str, Any]], date_str: str) -> int:
+    """Return the index of the first V4 forecast on or after the given date."""
+    low, high = 0, len(raw_forecasts)
+    while low < high:
+        mid = (low + high) // 2
+        if raw_forecasts[mid][CC_ATTR_TIMESTAMP] < date_str:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -116,6 +140,18 @@ async def async_setup_entry(
 class BaseClimaCellWeatherEntity(ClimaCellEntity, WeatherEntity):
     """Base ClimaCell weather entity."""
 
+    # Properties derived from coordinator data that are cached until the next update
+    _cached_properties: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the cached properties of the subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._cached_properties = tuple(
+            name
+            for name in dir(cls)
+            if isinstance(inspect.getattr_static(cls, name), cached_property)
+        )
+
     def __init__(
         self,
         config_entry: ConfigEntry,
@@ -145,6 +181,13 @@ class BaseClimaCellWeatherEntity(ClimaCellEntity, WeatherEntity):
         """Return the unique id of the entity."""
         return f"{self._config_entry.unique_id}_{self.forecast_type}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Clear cached properties and write the new state."""
+        for name in self._cached_properties:
+            self.__dict__.pop(name, None)
+        super()._handle_coordinator_update()
+
     @staticmethod
     @abstractmethod
     def _translate_condition(
@@ -152,10 +195,38 @@ class BaseClimaCellWeatherEntity(ClimaCellEntity, WeatherEntity):
     ) -> str | None:
         """Translate ClimaCell condition into an HA condition."""
 
+    def _sun_is_up_checker(self) -> Callable[[datetime], bool]:
+        """
+        Return a function that checks if the sun is up at a point in time.
+
+        The sun only rises and sets once per day, so the result is reused until
+        the next sun event instead of being recalculated for every forecast.
+        """
+        valid_from: datetime | None = None
+        valid_until: datetime | None = None
+        sun_is_up = True
+
+        def _sun_is_up(utc_point_in_time: datetime) -> bool:
+            nonlocal valid_from, valid_until, sun_is_up
+            if valid_from is None or not valid_from <= utc_point_in_time < valid_until:
+                next_sunrise = get_astral_event_next(
+                    self.hass, SUN_EVENT_SUNRISE, utc_point_in_time
+                )
+                next_sunset = get_astral_event_next(
+                    self.hass, SUN_EVENT_SUNSET, utc_point_in_time
+                )
+                valid_from = utc_point_in_time
+                valid_until = min(next_sunrise, next_sunset)
+                sun_is_up = next_sunrise > next_sunset
+            return sun_is_up
+
+        return _sun_is_up
+
     def _forecast_dict(
         self,
         forecast_dt: datetime,
-        use_datetime: bool,
+        sun_is_up: bool,
+        is_metric: bool,
         condition: str,
         precipitation: float | None,
         precipitation_probability: float | None,
@@ -165,54 +236,50 @@ class BaseClimaCellWeatherEntity(ClimaCellEntity, WeatherEntity):
         wind_speed: float | None,
     ) -> dict[str, Any]:
         """Return formatted Forecast dict from ClimaCell forecast data."""
-        if use_datetime:
-            translated_condition = self._translate_condition(
-                condition, is_up(self.hass, forecast_dt)
-            )
-        else:
-            translated_condition = self._translate_condition(condition, True)
+        translated_condition = self._translate_condition(condition, sun_is_up)
 
-        if self.hass.config.units.is_metric:
+        if is_metric:
             if precipitation:
-                precipitation = round(
-                    distance_convert(precipitation / 12, LENGTH_FEET, LENGTH_METERS)
-                    * 1000,
-                    4,
-                )
+                precipitation = round(precipitation * _IN_TO_MM, 4)
             if wind_speed:
-                wind_speed = round(
-                    distance_convert(wind_speed, LENGTH_MILES, LENGTH_KILOMETERS), 4
-                )
-
-        data = {
-            ATTR_FORECAST_TIME: forecast_dt.isoformat(),
-            ATTR_FORECAST_CONDITION: translated_condition,
-            ATTR_FORECAST_PRECIPITATION: precipitation,
-            ATTR_FORECAST_PRECIPITATION_PROBABILITY: precipitation_probability,
-            ATTR_FORECAST_TEMP: temp,
-            ATTR_FORECAST_TEMP_LOW: temp_low,
-            ATTR_FORECAST_WIND_BEARING: wind_direction,
-            ATTR_FORECAST_WIND_SPEED: wind_speed,
-        }
-
-        return {k: v for k, v in data.items() if v is not None}
-
-    @property
+                wind_speed = round(wind_speed * _MI_TO_KM, 4)
+
+        # Only include values that are available
+        data: dict[str, Any] = {ATTR_FORECAST_TIME: forecast_dt.isoformat()}
+        if translated_condition is not None:
+            data[ATTR_FORECAST_CONDITION] = translated_condition
+        if precipitation is not None:
+            data[ATTR_FORECAST_PRECIPITATION] = precipitation
+        if precipitation_probability is not None:
+            data[ATTR_FORECAST_PRECIPITATION_PROBABILITY] = precipitation_probability
+        if temp is not None:
+            data[ATTR_FORECAST_TEMP] = temp
+        if temp_low is not None:
+            data[ATTR_FORECAST_TEMP_LOW] = temp_low
+        if wind_direction is not None:
+            data[ATTR_FORECAST_WIND_BEARING] = wind_direction
+        if wind_speed is not None:
+            data[ATTR_FORECAST_WIND_SPEED] = wind_speed
+
+        return data
+
+    @cached_property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Return additional state attributes."""
         wind_gust = self.wind_gust
         if wind_gust and self.hass.config.units.is_metric:
-            wind_gust = round(
-                distance_convert(self.wind_gust, LENGTH_MILES, LENGTH_KILOMETERS), 4
-            )
+            wind_gust = round(wind_gust * _MI_TO_KM, 4)
         cloud_cover = self.cloud_cover
         if cloud_cover is not None:
             cloud_cover /= 100
-        return {
-            ATTR_CLOUD_COVER: cloud_cover,
-            ATTR_WIND_GUST: wind_gust,
-            ATTR_PRECIPITATION_TYPE: self.precipitation_type,
-        }
+        # Read-only since the same mapping is returned until the next update
+        return MappingProxyType(
+            {
+                ATTR_CLOUD_COVER: cloud_cover,
+                ATTR_WIND_GUST: wind_gust,
+                ATTR_PRECIPITATION_TYPE: self.precipitation_type,
+            }
+        )
 
     @property
     @abstractmethod
@@ -234,42 +301,39 @@ class BaseClimaCellWeatherEntity(ClimaCellEntity, WeatherEntity):
     def _pressure(self):
         """Return the raw pressure."""
 
-    @property
+    @cached_property
     def pressure(self):
         """Return the pressure."""
-        if self.hass.config.units.is_metric and self._pressure:
-            return round(
-                pressure_convert(self._pressure, PRESSURE_INHG, PRESSURE_HPA), 4
-            )
-        return self._pressure
+        pressure = self._pressure
+        if pressure and self.hass.config.units.is_metric:
+            return round(pressure * _INHG_TO_HPA, 4)
+        return pressure
 
     @property
     @abstractmethod
     def _wind_speed(self):
         """Return the raw wind speed."""
 
-    @property
+    @cached_property
     def wind_speed(self):
         """Return the wind speed."""
-        if self.hass.config.units.is_metric and self._wind_speed:
-            return round(
-                distance_convert(self._wind_speed, LENGTH_MILES, LENGTH_KILOMETERS), 4
-            )
-        return self._wind_speed
+        wind_speed = self._wind_speed
+        if wind_speed and self.hass.config.units.is_metric:
+            return round(wind_speed * _MI_TO_KM, 4)
+        return wind_speed
 
     @property
     @abstractmethod
     def _visibility(self):
         """Return the raw visibility."""
 
-    @property
+    @cached_property
     def visibility(self):
         """Return the visibility."""
-        if self.hass.config.units.is_metric and self._visibility:
-            return round(
-                distance_convert(self._visibility, LENGTH_MILES, LENGTH_KILOMETERS), 4
-            )
-        return self._visibility
+        visibility = self._visibility
+        if visibility and self.hass.config.units.is_metric:
+            return round(visibility * _MI_TO_KM, 4)
+        return visibility
 
 
 class ClimaCellWeatherEntity(BaseClimaCellWeatherEntity):
@@ -283,14 +347,13 @@ class ClimaCellWeatherEntity(BaseClimaCellWeatherEntity):
         if condition is None:
             return None
         # We won't guard here, instead we will fail hard
-        condition = WeatherCode(condition)
-        if condition in (WeatherCode.CLEAR, WeatherCode.MOSTLY_CLEAR):
+        if condition in _CLEAR_CODES:
             if sun_is_up:
                 return CLEAR_CONDITIONS["day"]
             return CLEAR_CONDITIONS["night"]
-        return CONDITIONS[condition]
+        return _CODE_TO_CONDITION[condition]
 
-    @property
+    @cached_property
     def temperature(self):
         """Return the platform temperature."""
         return self._get_current_property(CC_ATTR_TEMPERATURE)
@@ -305,45 +368,45 @@ class ClimaCellWeatherEntity(BaseClimaCellWeatherEntity):
         """Return the raw pressure."""
         return self._get_current_property(CC_ATTR_PRESSURE)
 
-    @property
+    @cached_property
     def humidity(self):
         """Return the humidity."""
         return self._get_current_property(CC_ATTR_HUMIDITY)
 
-    @property
+    @cached_property
     def wind_gust(self):
         """Return the wind gust speed."""
         return self._get_current_property(CC_ATTR_WIND_GUST)
 
-    @property
+    @cached_property
     def cloud_cover(self):
         """Reteurn the cloud cover."""
         return self._get_current_property(CC_ATTR_CLOUD_COVER)
 
-    @property
+    @cached_property
     def precipitation_type(self):
         """Return precipitation type."""
         precipitation_type = self._get_current_property(CC_ATTR_PRECIPITATION_TYPE)
         if precipitation_type is None:
             return None
-        return PrecipitationType(precipitation_type).name.lower()
+        return _PRECIPITATION_TYPES[precipitation_type]
 
     @property
     def _wind_speed(self):
         """Return the raw wind speed."""
         return self._get_current_property(CC_ATTR_WIND_SPEED)
 
-    @property
+    @cached_property
     def wind_bearing(self):
         """Return the wind bearing."""
         return self._get_current_property(CC_ATTR_WIND_DIRECTION)
 
-    @property
+    @cached_property
     def ozone(self):
         """Return the O3 (ozone) level."""
         return self._get_current_property(CC_ATTR_OZONE)
 
-    @property
+    @cached_property
     def condition(self):
         """Return the condition."""
         return self._translate_condition(
@@ -360,25 +423,40 @@ class ClimaCellWeatherEntity(BaseClimaCellWeatherEntity):
     def forecast(self):
         """Return the forecast."""
         # Check if forecasts are available
-        raw_forecasts = self.coordinator.data.get(FORECASTS, {}).get(self.forecast_type)
+        raw_forecasts = self.coordinator.data.get(FORECASTS, _EMPTY_MAP).get(
+            self.forecast_type
+        )
         if not raw_forecasts:
             return None
 
         forecasts = []
+        is_metric = self.hass.config.units.is_metric
+        sun_is_up = self._sun_is_up_checker()
         max_forecasts = MAX_FORECASTS[self.forecast_type]
-        forecast_count = 0
+
+        # Throw out past data. Forecasts are sorted by their ISO 8601 timestamps,
+        # whose date prefix compares like the date itself.
+        start = _first_forecast_index(
+            raw_forecasts, dt_util.utcnow().date().isoformat()
+        )
+
+        # Precipitation is forecasted as a per hour rate, so it needs to be
+        # scaled to the amount for the forecast period. This only depends on the
+        # forecast type, so work it out once instead of per forecast.
+        use_datetime = self.forecast_type != DAILY
+        if self.forecast_type == DAILY:
+            precipitation_factor = 24
+        elif self.forecast_type == NOWCAST:
+            # Nowcasts are forecasted in CONF_TIMESTEP increments
+            precipitation_factor = self._config_entry.options[CONF_TIMESTEP] / 60
+        else:
+            precipitation_factor = 1
 
         # Set default values (in cases where keys don't exist), None will be
         # returned. Override properties per forecast type as needed
-        for forecast in raw_forecasts:
+        for forecast in raw_forecasts[start : start + max_forecasts]:
             forecast_dt = dt_util.parse_datetime(forecast[CC_ATTR_TIMESTAMP])
-
-            # Throw out past data
-            if forecast_dt.date() < dt_util.utcnow().date():
-                continue
-
             values = forecast["values"]
-            use_datetime = True
 
             condition = values.get(CC_ATTR_CONDITION)
             precipitation = values.get(CC_ATTR_PRECIPITATION)
@@ -389,22 +467,14 @@ class ClimaCellWeatherEntity(BaseClimaCellWeatherEntity):
             wind_direction = values.get(CC_ATTR_WIND_DIRECTION)
             wind_speed = values.get(CC_ATTR_WIND_SPEED)
 
-            if self.forecast_type == DAILY:
-                use_datetime = False
-                if precipitation:
-                    precipitation = precipitation * 24
-            elif self.forecast_type == NOWCAST:
-                # Precipitation is forecasted in CONF_TIMESTEP increments but in a
-                # per hour rate, so value needs to be converted to an amount.
-                if precipitation:
-                    precipitation = (
-                        precipitation / 60 * self._config_entry.options[CONF_TIMESTEP]
-                    )
+            if precipitation:
+                precipitation = precipitation * precipitation_factor
 
             forecasts.append(
                 self._forecast_dict(
                     forecast_dt,
-                    use_datetime,
+                    sun_is_up(forecast_dt) if use_datetime else True,
+                    is_metric,
                     condition,
                     precipitation,
                     precipitation_probability,
@@ -415,10 +485,6 @@ class ClimaCellWeatherEntity(BaseClimaCellWeatherEntity):
                 )
             )
 
-            forecast_count += 1
-            if forecast_count == max_forecasts:
-                break
-
         return forecasts
 
 
@@ -432,13 +498,13 @@ class ClimaCellV3WeatherEntity(BaseClimaCellWeatherEntity):
         """Translate ClimaCell condition into an HA condition."""
         if not condition:
             return None
-        if "clear" in condition.lower():
+        if condition in _CLEAR_CONDITIONS_V3:
             if sun_is_up:
                 return CLEAR_CONDITIONS["day"]
             return CLEAR_CONDITIONS["night"]
         return CONDITIONS_V3[condition]
 
-    @property
+    @cached_property
     def temperature(self):
         """Return the platform temperature."""
         return self._get_cc_value(
@@ -455,24 +521,24 @@ class ClimaCellV3WeatherEntity(BaseClimaCellWeatherEntity):
         """Return the raw pressure."""
         return self._get_cc_value(self.coordinator.data[CURRENT], CC_V3_ATTR_PRESSURE)
 
-    @property
+    @cached_property
     def humidity(self):
         """Return the humidity."""
         return self._get_cc_value(self.coordinator.data[CURRENT], CC_V3_ATTR_HUMIDITY)
 
-    @property
+    @cached_property
     def wind_gust(self):
         """Return the wind gust speed."""
         return self._get_cc_value(self.coordinator.data[CURRENT], CC_V3_ATTR_WIND_GUST)
 
-    @property
+    @cached_property
     def cloud_cover(self):
         """Reteurn the cloud cover."""
         return self._get_cc_value(
             self.coordinator.data[CURRENT], CC_V3_ATTR_CLOUD_COVER
         )
 
-    @property
+    @cached_property
     def precipitation_type(self):
         """Return precipitation type."""
         return self._get_cc_value(
@@ -484,19 +550,19 @@ class ClimaCellV3WeatherEntity(BaseClimaCellWeatherEntity):
         """Return the raw wind speed."""
         return self._get_cc_value(self.coordinator.data[CURRENT], CC_V3_ATTR_WIND_SPEED)
 
-    @property
+    @cached_property
     def wind_bearing(self):
         """Return the wind bearing."""
         return self._get_cc_value(
             self.coordinator.data[CURRENT], CC_V3_ATTR_WIND_DIRECTION
         )
 
-    @property
+    @cached_property
     def ozone(self):
         """Return the O3 (ozone) level."""
         return self._get_cc_value(self.coordinator.data[CURRENT], CC_V3_ATTR_OZONE)
 
-    @property
+    @cached_property
     def condition(self):
         """Return the condition."""
         return self._translate_condition(
@@ -513,11 +579,15 @@ class ClimaCellV3WeatherEntity(BaseClimaCellWeatherEntity):
     def forecast(self):
         """Return the forecast."""
         # Check if forecasts are available
-        raw_forecasts = self.coordinator.data.get(FORECASTS, {}).get(self.forecast_type)
+        raw_forecasts = self.coordinator.data.get(FORECASTS, _EMPTY_MAP).get(
+            self.forecast_type
+        )
         if not raw_forecasts:
             return None
 
         forecasts = []
+        is_metric = self.hass.config.units.is_metric
+        sun_is_up = self._sun_is_up_checker()
 
         # Set default values (in cases where keys don't exist), None will be
         # returned. Override properties per forecast type as needed
@@ -542,22 +612,11 @@ class ClimaCellV3WeatherEntity(BaseClimaCellWeatherEntity):
                 precipitation = self._get_cc_value(
                     forecast, CC_V3_ATTR_PRECIPITATION_DAILY
                 )
-                temp = next(
-                    (
-                        self._get_cc_value(item, CC_V3_ATTR_TEMPERATURE_HIGH)
-                        for item in forecast[CC_V3_ATTR_TEMPERATURE]
-                        if "max" in item
-                    ),
-                    temp,
-                )
-                temp_low = next(
-                    (
-                        self._get_cc_value(item, CC_V3_ATTR_TEMPERATURE_LOW)
-                        for item in forecast[CC_V3_ATTR_TEMPERATURE]
-                        if "min" in item
-                    ),
-                    temp_low,
-                )
+                for item in forecast[CC_V3_ATTR_TEMPERATURE]:
+                    if "max" in item:
+                        temp = self._get_cc_value(item, CC_V3_ATTR_TEMPERATURE_HIGH)
+                    if "min" in item:
+                        temp_low = self._get_cc_value(item, CC_V3_ATTR_TEMPERATURE_LOW)
             elif self.forecast_type == NOWCAST and precipitation:
                 # Precipitation is forecasted in CONF_TIMESTEP increments but in a
                 # per hour rate, so value needs to be converted to an amount.
@@ -568,7 +627,8 @@ class ClimaCellV3WeatherEntity(BaseClimaCellWeatherEntity):
             forecasts.append(
                 self._forecast_dict(
                     forecast_dt,
-                    use_datetime,
+                    sun_is_up(forecast_dt) if use_datetime else True,
+                    is_metric,
                     condition,
                     precipitation,
                     precipitation_probability,
@@ -1,12 +1,28 @@
 """Offer geolocation automation rules."""
+import math
+
 import voluptuous as vol
 
 from homeassistant.components.geo_location import DOMAIN
-from homeassistant.const import CONF_EVENT, CONF_PLATFORM, CONF_SOURCE, CONF_ZONE
+from homeassistant.components.zone.const import ATTR_RADIUS
+from homeassistant.const import (
+    ATTR_GPS_ACCURACY,
+    ATTR_LATITUDE,
+    ATTR_LONGITUDE,
+    ATTR_RESTORED,
+    CONF_EVENT,
+    CONF_PLATFORM,
+    CONF_SOURCE,
+    CONF_ZONE,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import HassJob, callback
 from homeassistant.helpers import condition, config_validation as cv
 from homeassistant.helpers.config_validation import entity_domain
-from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
+from homeassistant.helpers.event import (
+    async_track_state_added_domain,
+    async_track_state_change_event,
+)
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -14,6 +30,12 @@ EVENT_ENTER = "enter"
 EVENT_LEAVE = "leave"
 DEFAULT_EVENT = EVENT_ENTER
 
+# Mean earth radius in meters used for the spherical distance estimate
+EARTH_RADIUS = 6371008.8
+# Relative error allowed on the spherical estimate. Zones measure distance
+# on the WGS-84 ellipsoid, which differs from a sphere by less than 0.6%.
+DISTANCE_MARGIN = 0.01
+
 TRIGGER_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_PLATFORM): "geo_location",
@@ -31,6 +53,28 @@ def source_match(state, source):
     return state and state.attributes.get("source") == source
 
 
+def position(state):
+    """Return the attributes that determine if a state is in a zone."""
+    attributes = state.attributes
+    return (
+        attributes.get(ATTR_LATITUDE),
+        attributes.get(ATTR_LONGITUDE),
+        attributes.get(ATTR_GPS_ACCURACY),
+    )
+
+
+def zone_geometry(zone_state):
+    """Return the center in radians and radius of a zone, if it can be used."""
+    if zone_state is None or zone_state.state == STATE_UNAVAILABLE:
+        return None
+    latitude = zone_state.attributes.get(ATTR_LATITUDE)
+    longitude = zone_state.attributes.get(ATTR_LONGITUDE)
+    radius = zone_state.attributes.get(ATTR_RADIUS)
+    if latitude is None or longitude is None or radius is None:
+        return None
+    return math.radians(latitude), math.radians(longitude), radius
+
+
 async def async_attach_trigger(hass, config, action, automation_info):
     """Listen for state changes based on configuration."""
     trigger_id = automation_info.get("trigger_id") if automation_info else None
@@ -38,22 +82,59 @@ async def async_attach_trigger(hass, config, action, automation_info):
     zone_entity_id = config.get(CONF_ZONE)
     trigger_event = config.get(CONF_EVENT)
     job = HassJob(action)
+    zone_state = hass.states.get(zone_entity_id)
+    geometry = zone_geometry(zone_state)
 
     @callback
-    def state_change_listener(event):
-        """Handle specific state changes."""
+    def zone_change_listener(event):
+        """Update the cached zone when it changes."""
+        nonlocal zone_state, geometry
+        zone_state = event.data.get("new_state")
+        geometry = zone_geometry(zone_state)
+
+    def in_zone(state):
+        """Check if a state is in the zone.
+
+        A cheap spherical distance settles most checks; positions too close to
+        the zone border fall back to the exact zone condition.
+        """
+        if not state:
+            return False
+        latitude = state.attributes.get(ATTR_LATITUDE)
+        longitude = state.attributes.get(ATTR_LONGITUDE)
+        if geometry is None or latitude is None or longitude is None:
+            return condition.zone(hass, zone_state, state)
+
+        zone_lat, zone_lon, radius = geometry
+        lat = math.radians(latitude)
+        hav = (
+            math.sin((lat - zone_lat) / 2) ** 2
+            + math.cos(lat)
+            * math.cos(zone_lat)
+            * math.sin((math.radians(longitude) - zone_lon) / 2) ** 2
+        )
+        estimate = 2 * EARTH_RADIUS * math.asin(math.sqrt(min(hav, 1)))
+        accuracy = state.attributes.get(ATTR_GPS_ACCURACY, 0)
+
+        if estimate * (1 - DISTANCE_MARGIN) - accuracy >= radius:
+            return False
+        if estimate * (1 + DISTANCE_MARGIN) - accuracy < radius:
+            return True
+        return condition.zone(hass, zone_state, state)
+
+    @callback
+    def handle_state_change(event, from_state, to_state):
+        """Handle a state change of a followed entity."""
         # Skip if the event's source does not match the trigger's source.
-        from_state = event.data.get("old_state")
-        to_state = event.data.get("new_state")
         if not source_match(from_state, source) and not source_match(to_state, source):
             return
 
-        zone_state = hass.states.get(zone_entity_id)
+        # An entity that did not move can neither enter nor leave the zone.
+        if from_state and to_state and position(from_state) == position(to_state):
+            return
 
-        from_match = (
-            condition.zone(hass, zone_state, from_state) if from_state else False
-        )
-        to_match = condition.zone(hass, zone_state, to_state) if to_state else False
+        from_match = in_zone(from_state)
+        to_match = in_zone(to_state)
 
         if (
             trigger_event == EVENT_ENTER
@@ -81,6 +162,83 @@ async def async_attach_trigger(hass, config, action, automation_info):
                 event.context,
             )
 
-    return async_track_state_change_filtered(
-        hass, TrackStates(False, set(), {DOMAIN}), state_change_listener
-    ).async_remove
+    # Only follow entities of the trigger's source. The source of a geolocation
+    # entity is fixed by its platform, so it is checked when the entity is added.
+    # Entity registry placeholders don't have a source yet; they are followed
+    # until the real entity replaces them, which is then handled as an add.
+    entity_listeners = {}
+
+    @callback
+    def follow_entity(entity_id):
+        """Start following state changes of an entity."""
+        if entity_id not in entity_listeners:
+            entity_listeners[entity_id] = async_track_state_change_event(
+                hass, [entity_id], entity_change_listener
+            )
+
+    @callback
+    def unfollow_entity(entity_id):
+        """Stop following state changes of an entity."""
+        remove_listener = entity_listeners.pop(entity_id, None)
+        if remove_listener is not None:
+            remove_listener()
+
+    @callback
+    def entity_added(event, state):
+        """Follow an added entity if it is of the trigger's source."""
+        entity_id = event.data.get("entity_id")
+        if state.attributes.get(ATTR_RESTORED):
+            follow_entity(entity_id)
+            return
+
+        if not source_match(state, source):
+            unfollow_entity(entity_id)
+            return
+
+        follow_entity(entity_id)
+        handle_state_change(event, None, state)
+
+    @callback
+    def entity_change_listener(event):
+        """Handle state changes of followed entities."""
+        from_state = event.data.get("old_state")
+        to_state = event.data.get("new_state")
+
+        # Added entities are handled by entity_added_listener
+        if from_state is None:
+            return
+
+        if to_state is None:
+            unfollow_entity(event.data.get("entity_id"))
+        elif from_state.attributes.get(ATTR_RESTORED):
+            entity_added(event, to_state)
+            return
+
+        handle_state_change(event, from_state, to_state)
+
+    @callback
+    def entity_added_listener(event):
+        """Handle entities added to the geolocation domain."""
+        entity_added(event, event.data.get("new_state"))
+
+    for state in hass.states.async_all(DOMAIN):
+        if state.attributes.get(ATTR_RESTORED) or source_match(state, source):
+            follow_entity(state.entity_id)
+
+    remove_added_listener = async_track_state_added_domain(
+        hass, DOMAIN, entity_added_listener
+    )
+    remove_zone_listener = async_track_state_change_event(
+        hass, [zone_entity_id], zone_change_listener
+    )
+
+    @callback
+    def async_remove():
+        """Remove state listeners."""
+        remove_zone_listener()
+        remove_added_listener()
+        for remove_listener in entity_listeners.values():
+            remove_listener()
+        entity_listeners.clear()
+
+    return async_remove
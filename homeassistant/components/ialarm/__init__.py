@@ -24,11 +24,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     port = entry.data[CONF_PORT]
     ialarm = IAlarm(host, port)
 
-    try:
-        async with timeout(10):
-            mac = await hass.async_add_executor_job(ialarm.get_mac)
-    except (asyncio.TimeoutError, ConnectionError) as ex:
-        raise ConfigEntryNotReady from ex
+    # The config flow stores the MAC address as unique ID, so only ask the
+    # device for it when the entry doesn't have one.
+    mac = entry.unique_id
+    if mac is None:
+        try:
+            async with timeout(10):
+                mac = await hass.async_add_executor_job(ialarm.get_mac)
+        except (asyncio.TimeoutError, ConnectionError) as ex:
+            raise ConfigEntryNotReady from ex
 
     coordinator = IAlarmDataUpdateCoordinator(hass, ialarm, mac)
     await coordinator.async_config_entry_first_refresh()
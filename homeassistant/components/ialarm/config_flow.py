@@ -1,6 +1,8 @@
 """Config flow for Antifurto365 iAlarm integration."""
+import asyncio
 import logging
 
+from async_timeout import timeout
 from pyialarm import IAlarm
 import voluptuous as vol
 
@@ -21,7 +23,8 @@ DATA_SCHEMA = vol.Schema(
 
 async def _get_device_mac(hass: core.HomeAssistant, host, port):
     ialarm = IAlarm(host, port)
-    return await hass.async_add_executor_job(ialarm.get_mac)
+    async with timeout(10):
+        return await hass.async_add_executor_job(ialarm.get_mac)
 
 
 class IAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -45,7 +48,7 @@ class IAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # If we are able to get the MAC address, we are able to establish
             # a connection to the device.
             mac = await _get_device_mac(self.hass, host, port)
-        except ConnectionError:
+        except (asyncio.TimeoutError, ConnectionError):
             errors["base"] = "cannot_connect"
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Unexpected exception")
@@ -1,11 +1,13 @@
 """Tests for Climacell weather entity."""
 from __future__ import annotations
 
-from datetime import datetime
+from copy import deepcopy
+from datetime import datetime, timedelta
 import logging
-from typing import Any
+from typing import Any, Callable
 from unittest.mock import patch
 
+from pyclimacell.const import CURRENT, FORECASTS, HOURLY, NOWCAST
 import pytest
 import pytz
 
@@ -21,6 +23,7 @@ from homeassistant.components.climacell.const import (
     DOMAIN,
 )
 from homeassistant.components.weather import (
+    ATTR_CONDITION_CLEAR_NIGHT,
     ATTR_CONDITION_CLOUDY,
     ATTR_CONDITION_RAINY,
     ATTR_CONDITION_SNOWY,
@@ -46,7 +49,9 @@ from homeassistant.components.weather import (
 from homeassistant.const import ATTR_ATTRIBUTION, ATTR_FRIENDLY_NAME
 from homeassistant.core import State, callback
 from homeassistant.helpers.entity_registry import async_get
+from homeassistant.helpers.sun import is_up
 from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.util import dt as dt_util
 
 from .const import API_V3_ENTRY_DATA, API_V4_ENTRY_DATA
 
@@ -54,6 +59,10 @@ from tests.common import MockConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+NOW = datetime(2021, 3, 6, 23, 59, 59, tzinfo=pytz.UTC)
+# Sun sets around 01:50 UTC and rises around 14:10 UTC at the test location
+SUNSET_FORECAST_START = datetime(2021, 3, 8, 1, 0, tzinfo=pytz.UTC)
+
 
 @callback
 def _enable_entity(hass: HomeAssistantType, entity_name: str) -> None:
@@ -69,10 +78,7 @@ def _enable_entity(hass: HomeAssistantType, entity_name: str) -> None:
 
 async def _setup(hass: HomeAssistantType, config: dict[str, Any]) -> State:
     """Set up entry and return entity state."""
-    with patch(
-        "homeassistant.util.dt.utcnow",
-        return_value=datetime(2021, 3, 6, 23, 59, 59, tzinfo=pytz.UTC),
-    ):
+    with patch("homeassistant.util.dt.utcnow", return_value=NOW):
         data = _get_config_schema(hass)(config)
         config_entry = MockConfigEntry(
             domain=DOMAIN,
@@ -91,6 +97,42 @@ async def _setup(hass: HomeAssistantType, config: dict[str, Any]) -> State:
     return hass.states.get("weather.climacell_daily")
 
 
+async def _update_data(
+    hass: HomeAssistantType, update: Callable[[dict[str, Any]], None]
+) -> None:
+    """Update a copy of the coordinator data and push it to the entities."""
+    config_entry = hass.config_entries.async_entries(DOMAIN)[0]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    data = deepcopy(coordinator.data)
+    update(data)
+    with patch("homeassistant.util.dt.utcnow", return_value=NOW):
+        coordinator.async_set_updated_data(data)
+        await hass.async_block_till_done()
+
+
+def _forecast_times() -> dict[str, Callable[[int], datetime]]:
+    """Return forecast times per forecast type that span a sunset."""
+    return {
+        HOURLY: lambda index: SUNSET_FORECAST_START + timedelta(hours=index),
+        NOWCAST: lambda index: SUNSET_FORECAST_START + timedelta(minutes=5 * index),
+    }
+
+
+def _assert_sun_conditions(hass: HomeAssistantType, entity_id: str) -> None:
+    """Assert clear forecasts are sunny during the day and clear at night."""
+    conditions = set()
+    for forecast in hass.states.get(entity_id).attributes[ATTR_FORECAST]:
+        forecast_dt = dt_util.parse_datetime(forecast[ATTR_FORECAST_TIME])
+        if is_up(hass, forecast_dt):
+            assert forecast[ATTR_FORECAST_CONDITION] == ATTR_CONDITION_SUNNY
+        else:
+            assert forecast[ATTR_FORECAST_CONDITION] == ATTR_CONDITION_CLEAR_NIGHT
+        conditions.add(forecast[ATTR_FORECAST_CONDITION])
+
+    # Make sure the forecasts actually crossed a sun event
+    assert conditions == {ATTR_CONDITION_SUNNY, ATTR_CONDITION_CLEAR_NIGHT}
+
+
 async def test_v3_weather(
     hass: HomeAssistantType,
     climacell_config_entry_update: pytest.fixture,
@@ -234,6 +276,27 @@ async def test_v3_weather(
     assert weather_state.attributes[ATTR_PRECIPITATION_TYPE] == "rain"
 
 
+async def test_v3_weather_sun_conditions(
+    hass: HomeAssistantType,
+    climacell_config_entry_update: pytest.fixture,
+) -> None:
+    """Test v3 hourly and nowcast clear conditions follow the sun."""
+    await _setup(hass, API_V3_ENTRY_DATA)
+
+    def _clear_around_sunset(data: dict[str, Any]) -> None:
+        for forecast_type, forecast_time in _forecast_times().items():
+            for index, forecast in enumerate(data[FORECASTS][forecast_type]):
+                forecast["observation_time"] = {
+                    "value": forecast_time(index).isoformat()
+                }
+                forecast["weather_code"] = {"value": "clear"}
+
+    await _update_data(hass, _clear_around_sunset)
+
+    _assert_sun_conditions(hass, "weather.climacell_hourly")
+    _assert_sun_conditions(hass, "weather.climacell_nowcast")
+
+
 async def test_v4_weather(
     hass: HomeAssistantType,
     climacell_config_entry_update: pytest.fixture,
@@ -395,3 +458,136 @@ async def test_v4_weather(
     assert weather_state.attributes[ATTR_CLOUD_COVER] == 1
     assert weather_state.attributes[ATTR_WIND_GUST] == 20.3421
     assert weather_state.attributes[ATTR_PRECIPITATION_TYPE] == "rain"
+
+    def _set_precipitation(data: dict[str, Any]) -> None:
+        data[FORECASTS][HOURLY][0]["values"]["precipitationIntensityAvg"] = 0.5
+        data[FORECASTS][NOWCAST][0]["values"]["precipitationIntensityAvg"] = 1
+
+    await _update_data(hass, _set_precipitation)
+
+    # Precipitation is forecasted as an in/hr rate, hourly forecasts cover an hour
+    hourly = hass.states.get("weather.climacell_hourly").attributes[ATTR_FORECAST]
+    assert hourly[0][ATTR_FORECAST_PRECIPITATION] == 12.7
+    # Nowcasts only cover the configured 15 minute timestep
+    nowcast = hass.states.get("weather.climacell_nowcast").attributes[ATTR_FORECAST]
+    assert nowcast[0][ATTR_FORECAST_PRECIPITATION] == 6.35
+
+
+async def test_v4_weather_sun_conditions(
+    hass: HomeAssistantType,
+    climacell_config_entry_update: pytest.fixture,
+) -> None:
+    """Test v4 hourly and nowcast clear conditions follow the sun."""
+    await _setup(hass, API_V4_ENTRY_DATA)
+
+    def _clear_around_sunset(data: dict[str, Any]) -> None:
+        for forecast_type, forecast_time in _forecast_times().items():
+            for index, forecast in enumerate(data[FORECASTS][forecast_type]):
+                forecast["startTime"] = forecast_time(index).isoformat()
+                forecast["values"]["weatherCode"] = 1000
+
+    await _update_data(hass, _clear_around_sunset)
+
+    _assert_sun_conditions(hass, "weather.climacell_hourly")
+    _assert_sun_conditions(hass, "weather.climacell_nowcast")
+
+
+async def test_v3_weather_coordinator_update(
+    hass: HomeAssistantType,
+    climacell_config_entry_update: pytest.fixture,
+) -> None:
+    """Test v3 weather entity picks up new data on coordinator update."""
+    await _setup(hass, API_V3_ENTRY_DATA)
+
+    def _update_current(data: dict[str, Any]) -> None:
+        data[CURRENT].update(
+            {
+                "weather_code": {"value": "cloudy"},
+                "temp": {"value": 68, "units": "F"},
+                "baro_pressure": {"value": 30, "units": "inHg"},
+                "humidity": {"value": 50, "units": "%"},
+                "wind_speed": {"value": 10, "units": "mph"},
+                "wind_direction": {"value": 90, "units": "degrees"},
+                "wind_gust": {"value": 20, "units": "mph"},
+                "visibility": {"value": 5, "units": "mi"},
+                "o3": {"value": 40, "units": "ppb"},
+                "cloud_cover": {"value": 50, "units": "%"},
+                "precipitation_type": {"value": "snow"},
+            }
+        )
+
+    await _update_data(hass, _update_current)
+
+    weather_state = hass.states.get("weather.climacell_daily")
+    assert weather_state.state == ATTR_CONDITION_CLOUDY
+    assert weather_state.attributes[ATTR_WEATHER_TEMPERATURE] == 20
+    assert weather_state.attributes[ATTR_WEATHER_PRESSURE] == 1015.9167
+    assert weather_state.attributes[ATTR_WEATHER_HUMIDITY] == 50
+    assert weather_state.attributes[ATTR_WEATHER_WIND_SPEED] == 16.0934
+    assert weather_state.attributes[ATTR_WEATHER_WIND_BEARING] == 90
+    assert weather_state.attributes[ATTR_WEATHER_VISIBILITY] == 8.0467
+    assert weather_state.attributes[ATTR_WEATHER_OZONE] == 40
+    assert weather_state.attributes[ATTR_CLOUD_COVER] == 0.5
+    assert weather_state.attributes[ATTR_WIND_GUST] == 32.1869
+    assert weather_state.attributes[ATTR_PRECIPITATION_TYPE] == "snow"
+
+
+async def test_v4_weather_coordinator_update(
+    hass: HomeAssistantType,
+    climacell_config_entry_update: pytest.fixture,
+) -> None:
+    """Test v4 weather entity picks up new data on coordinator update."""
+    await _setup(hass, API_V4_ENTRY_DATA)
+
+    def _update_current(data: dict[str, Any]) -> None:
+        data[CURRENT].update(
+            {
+                "weatherCode": 1001,
+                "temperature": 68,
+                "pressureSeaLevel": 30,
+                "humidity": 50,
+                "windSpeed": 10,
+                "windDirection": 90,
+                "windGust": None,
+                "visibility": 5,
+                "pollutantO3": 40,
+                "cloudCover": 50,
+                "precipitationType": 2,
+            }
+        )
+
+    await _update_data(hass, _update_current)
+
+    weather_state = hass.states.get("weather.climacell_daily")
+    assert weather_state.state == ATTR_CONDITION_CLOUDY
+    assert weather_state.attributes[ATTR_WEATHER_TEMPERATURE] == 20
+    assert weather_state.attributes[ATTR_WEATHER_PRESSURE] == 1015.9167
+    assert weather_state.attributes[ATTR_WEATHER_HUMIDITY] == 50
+    assert weather_state.attributes[ATTR_WEATHER_WIND_SPEED] == 16.0934
+    assert weather_state.attributes[ATTR_WEATHER_WIND_BEARING] == 90
+    assert weather_state.attributes[ATTR_WEATHER_VISIBILITY] == 8.0467
+    assert weather_state.attributes[ATTR_WEATHER_OZONE] == 40
+    assert weather_state.attributes[ATTR_CLOUD_COVER] == 0.5
+    assert weather_state.attributes[ATTR_WIND_GUST] is None
+    assert weather_state.attributes[ATTR_PRECIPITATION_TYPE] == "snow"
+
+
+async def test_v4_weather_skips_past_forecasts(
+    hass: HomeAssistantType,
+    climacell_config_entry_update: pytest.fixture,
+) -> None:
+    """Test v4 weather forecast drops forecasts from previous days."""
+    await _setup(hass, API_V4_ENTRY_DATA)
+    config_entry = hass.config_entries.async_entries(DOMAIN)[0]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    with patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=datetime(2021, 3, 9, 12, 0, 0, tzinfo=pytz.UTC),
+    ):
+        coordinator.async_set_updated_data(coordinator.data)
+        await hass.async_block_till_done()
+
+    forecast = hass.states.get("weather.climacell_daily").attributes[ATTR_FORECAST]
+    assert len(forecast) == 13
+    assert forecast[0][ATTR_FORECAST_TIME] == "2021-03-09T11:00:00+00:00"
@@ -2,7 +2,13 @@
 import pytest
 
 from homeassistant.components import automation, zone
-from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL, SERVICE_TURN_OFF
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_RESTORED,
+    ENTITY_MATCH_ALL,
+    SERVICE_TURN_OFF,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import Context
 from homeassistant.setup import async_setup_component
 
@@ -318,3 +324,193 @@ async def test_if_fires_on_zone_disappear(hass, calls):
     assert (
         calls[0].data["some"] == "geo_location - geo_location.entity - hello -  - test"
     )
+
+
+async def test_if_fires_on_zone_enter_near_border(hass, calls):
+    """Test for firing on zone enter right at the zone border."""
+    hass.states.async_set(
+        "geo_location.entity",
+        "hello",
+        {"latitude": 32.881011, "longitude": -117.234758, "source": "test_source"},
+    )
+    await hass.async_block_till_done()
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "geo_location",
+                    "source": "test_source",
+                    "zone": "zone.test",
+                    "event": "enter",
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    # Half a meter outside the zone radius.
+    hass.states.async_set(
+        "geo_location.entity",
+        "hello",
+        {"latitude": 32.8830957, "longitude": -117.237561, "source": "test_source"},
+    )
+    await hass.async_block_till_done()
+
+    assert len(calls) == 0
+
+    # One meter inside the zone radius.
+    hass.states.async_set(
+        "geo_location.entity",
+        "hello",
+        {"latitude": 32.8830822, "longitude": -117.237561, "source": "test_source"},
+    )
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+
+
+async def test_if_fires_on_zone_enter_after_zone_update(hass, calls):
+    """Test for firing on enter of a zone that changed after setup."""
+    hass.states.async_set(
+        "geo_location.entity",
+        "hello",
+        {"latitude": 32.881011, "longitude": -117.234758, "source": "test_source"},
+    )
+    await hass.async_block_till_done()
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "geo_location",
+                    "source": "test_source",
+                    "zone": "zone.test",
+                    "event": "enter",
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.states.async_set(
+        "zone.test",
+        "0",
+        {"latitude": 32.885, "longitude": -117.234758, "radius": 250},
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set(
+        "geo_location.entity",
+        "hello",
+        {"latitude": 32.885, "longitude": -117.234758, "source": "test_source"},
+    )
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+
+
+async def test_if_fires_on_zone_enter_of_entity_added_later(hass, calls):
+    """Test for firing on zone enter of an entity added after setup."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "geo_location",
+                    "source": "test_source",
+                    "zone": "zone.test",
+                    "event": "enter",
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.states.async_set(
+        "geo_location.other",
+        "hello",
+        {"latitude": 32.881011, "longitude": -117.234758, "source": "other_source"},
+    )
+    hass.states.async_set(
+        "geo_location.entity",
+        "hello",
+        {"latitude": 32.881011, "longitude": -117.234758, "source": "test_source"},
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set(
+        "geo_location.other",
+        "hello",
+        {"latitude": 32.880586, "longitude": -117.237564, "source": "other_source"},
+    )
+    await hass.async_block_till_done()
+
+    assert len(calls) == 0
+
+    hass.states.async_set(
+        "geo_location.entity",
+        "hello",
+        {"latitude": 32.880586, "longitude": -117.237564, "source": "test_source"},
+    )
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+
+
+async def test_if_fires_on_zone_enter_of_entity_replacing_placeholder(hass, calls):
+    """Test for firing on zone enter of an entity restored from the registry."""
+    for entity_id in ("geo_location.entity", "geo_location.other"):
+        hass.states.async_set(entity_id, STATE_UNAVAILABLE, {ATTR_RESTORED: True})
+    await hass.async_block_till_done()
+
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "geo_location",
+                    "source": "test_source",
+                    "zone": "zone.test",
+                    "event": "enter",
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.states.async_set(
+        "geo_location.other",
+        "hello",
+        {"latitude": 32.880586, "longitude": -117.237564, "source": "other_source"},
+    )
+    hass.states.async_set(
+        "geo_location.entity",
+        "hello",
+        {"latitude": 32.880586, "longitude": -117.237564, "source": "test_source"},
+    )
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+
+    # Leave and enter the zone again
+    hass.states.async_set(
+        "geo_location.entity",
+        "hello",
+        {"latitude": 32.881011, "longitude": -117.234758, "source": "test_source"},
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set(
+        "geo_location.entity",
+        "hello",
+        {"latitude": 32.880586, "longitude": -117.237564, "source": "test_source"},
+    )
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
@@ -1,6 +1,9 @@
 """Test the Antifurto365 iAlarm config flow."""
+import threading
 from unittest.mock import patch
 
+from async_timeout import timeout
+
 from homeassistant import config_entries, data_entry_flow, setup
 from homeassistant.components.ialarm.const import DOMAIN
 from homeassistant.const import CONF_HOST, CONF_PORT
@@ -60,6 +63,37 @@ async def test_form_cannot_connect(hass):
     assert result2["errors"] == {"base": "cannot_connect"}
 
 
+async def test_form_timeout(hass):
+    """Test we handle a device that doesn't respond."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    device_responded = threading.Event()
+
+    def get_mac(ialarm):
+        """Block like a device that doesn't respond."""
+        device_responded.wait(5)
+        return TEST_MAC
+
+    # Shorten the timeout so the test doesn't have to wait for it
+    with patch(
+        "homeassistant.components.ialarm.config_flow.timeout",
+        side_effect=lambda delay: timeout(0.01),
+    ) as mock_timeout, patch(
+        "homeassistant.components.ialarm.config_flow.IAlarm.get_mac",
+        new=get_mac,
+    ):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], TEST_DATA
+        )
+        device_responded.set()
+
+    mock_timeout.assert_called_once_with(10)
+    assert result2["type"] == data_entry_flow.RESULT_TYPE_FORM
+    assert result2["errors"] == {"base": "cannot_connect"}
+
+
 async def test_form_exception(hass):
     """Test we handle unknown exception."""
     result = await hass.config_entries.flow.async_init(
@@ -32,6 +32,17 @@ def mock_config_fixture():
     )
 
 
+@pytest.fixture(name="mock_config_entry_with_unique_id")
+def mock_config_with_unique_id_fixture():
+    """Return a fake config entry with the MAC address as unique ID."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="00:00:54:12:34:56",
+        data={CONF_HOST: "192.168.10.20", CONF_PORT: 18034},
+        entry_id=str(uuid4()),
+    )
+
+
 async def test_setup_entry(hass, ialarm_api, mock_config_entry):
     """Test setup entry."""
     ialarm_api.return_value.get_mac = Mock(return_value="00:00:54:12:34:56")
@@ -65,3 +76,35 @@ async def test_unload_entry(hass, ialarm_api, mock_config_entry):
     assert mock_config_entry.state == ENTRY_STATE_LOADED
     assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
     assert mock_config_entry.state == ENTRY_STATE_NOT_LOADED
+
+
+async def test_setup_entry_with_unique_id(
+    hass, ialarm_api, mock_config_entry_with_unique_id
+):
+    """Test setup entry uses the MAC address stored as unique ID."""
+    ialarm_api.return_value.get_mac = Mock(side_effect=ConnectionError)
+
+    mock_config_entry_with_unique_id.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(
+        mock_config_entry_with_unique_id.entry_id
+    )
+    await hass.async_block_till_done()
+
+    ialarm_api.return_value.get_mac.assert_not_called()
+    assert mock_config_entry_with_unique_id.state == ENTRY_STATE_LOADED
+
+
+async def test_setup_not_ready_with_unique_id(
+    hass, ialarm_api, mock_config_entry_with_unique_id
+):
+    """Test setup failed because the first status refresh can't connect."""
+    ialarm_api.return_value.get_status = Mock(side_effect=ConnectionError)
+
+    mock_config_entry_with_unique_id.add_to_hass(hass)
+    assert not await hass.config_entries.async_setup(
+        mock_config_entry_with_unique_id.entry_id
+    )
+    await hass.async_block_till_done()
+
+    ialarm_api.return_value.get_mac.assert_not_called()
+    assert mock_config_entry_with_unique_id.state == ENTRY_STATE_SETUP_RETRY